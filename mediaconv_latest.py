@@ -32,13 +32,38 @@ For more information and updates, visit the project repository:
 """  # noqa: E501
 
 import argparse
+import asyncio
+import json
 import logging
 import os
-import platform
 import subprocess
 import sys
 import time
-from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+
+# Extensions worth probing with ffprobe; anything else is skipped without
+# spawning a subprocess.
+FILE_EXTENSIONS = frozenset(
+    {
+        ".avi",
+        ".flv",
+        ".mkv",
+        ".mov",
+        ".mp4",
+        ".mpeg",
+        ".mpg",
+        ".webm",
+        ".wmv",
+    }
+)
+
+# Platform facts do not change mid-run; compute them once at import
+# instead of per call in the scan and conversion paths.
+_IS_WINDOWS = sys.platform.startswith("win")
+_FFMPEG = "ffmpeg.exe" if _IS_WINDOWS else "ffmpeg"
+
+# Single module-level logger; handlers are attached once in setup_logger.
+logger = logging.getLogger("mediaconv")
 
 
 def validate_directories(input_directory, output_directory):
@@ -73,23 +98,24 @@ def setup_logger(log_directory, enable_console=False):
         log_directory, f"{current_time}_conversion_log{log_file_extension}"
     )
 
-    logging.basicConfig(
-        filename=log_file_path,
-        level=logging.INFO,
-        format="%(asctime)s - %(levelname)s: %(message)s",
+    formatter = logging.Formatter(
+        "%(asctime)s - %(levelname)s: %(message)s",
         datefmt="%Y-%m-%d %H:%M:%S",
     )
 
+    file_handler = logging.FileHandler(log_file_path, mode="w", encoding="utf-8")
+    # Line buffering makes progress visible in the log as it happens
+    # instead of only at flush points.
+    file_handler.stream.reconfigure(line_buffering=True)
+    file_handler.setFormatter(formatter)
+    logger.addHandler(file_handler)
+    logger.setLevel(logging.INFO)
+
     # Check if console output should be enabled
     if enable_console:
         console_handler = logging.StreamHandler()
         console_handler.setLevel(logging.INFO)
-        formatter = logging.Formatter(
-            "%(asctime)s - %(levelname)s: %(message)s",
-            datefmt="%Y-%m-%d %H:%M:%S",
-        )
         console_handler.setFormatter(formatter)
-        logger = logging.getLogger()
         logger.addHandler(console_handler)
 
     return log_file_path
@@ -100,34 +126,55 @@ def scan_directory(input_directory):
     Scans the input directory for files to be converted to .mp4 using FFmpeg.
 
     :param input_directory: The directory to scan for video files.
-    :return: A list of matching file paths and a list of log messages.
+    :return: A list of matching file paths, a list of log messages, and
+        a dict mapping each matching path to its probed
+        (video codec, audio codec) pair.
     """
     log_messages = []
     matching_files = []
+    codecs = {}
 
-    system_platform = platform.system()
+    candidate_files = []
 
     for file_name in os.scandir(input_directory):
         if file_name.is_dir():
             continue
         if file_name.is_file():
-            result, log_message = check_file_convertibility(file_name.path)
+            # Skip obvious non-video files before paying for an ffprobe run.
+            if os.path.splitext(file_name.name)[1].lower() not in FILE_EXTENSIONS:
+                log_messages.append(
+                    f'"{file_name.name}" is not a recognized video format.'
+                )
+                continue
+            candidate_files.append(file_name.path)
+        else:
+            log_messages.append(f'"{file_name.name}" is not a file.')
+
+    # Probe candidates in parallel; each probe blocks on a short ffprobe
+    # run, so overlapping them amortizes the per-process startup cost.
+    if candidate_files:
+        max_workers = min(32, len(candidate_files), (os.cpu_count() or 1) * 4)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            probe_results = executor.map(check_file_convertibility, candidate_files)
+        for file_path, (result, log_message, video_codec, audio_codec) in zip(
+            candidate_files, probe_results
+        ):
             if result:
-                matching_files.append(file_name.path)
+                matching_files.append(file_path)
+                codecs[file_path] = (video_codec, audio_codec)
             else:
                 log_messages.append(log_message)
-        else:
-            log_messages.append(f'"{file_name.name}" is not a file.')
 
     if not matching_files:
         log_messages.append("No matching files found in directory.")
-        return None, log_messages
+        return None, log_messages, codecs
 
     # Normalize file paths for Windows
-    if system_platform == "Windows":
+    if _IS_WINDOWS:
         matching_files = [os.path.abspath(file) for file in matching_files]
+        codecs = {os.path.abspath(file): codec for file, codec in codecs.items()}
 
-    return matching_files, log_messages
+    return matching_files, log_messages, codecs
 
 
 def check_file_convertibility(file_path):
@@ -138,36 +185,56 @@ def check_file_convertibility(file_path):
     error or success message.
 
     :param file_path: The path of the file to check for convertibility.
-    :return: A tuple (result, log_message) indicating the result and a log message.
+    :return: A tuple (result, log_message, video_codec, audio_codec); the
+        codec names let the conversion step pick a stream copy over a
+        re-encode.
     """
     try:
         result = subprocess.run(
             [
                 "ffprobe",
                 "-hide_banner",
+                # Cap format detection at 32KB; codec identification does
+                # not need the multi-second default read window.
+                "-analyzeduration",
+                "0",
+                "-probesize",
+                "32768",
                 "-v",
                 "error",
-                "-select_streams",
-                "v:0",
                 "-show_entries",
-                "stream=codec_name",
+                "stream=codec_name,codec_type",
                 "-of",
-                "csv=p=0",
+                "json",
                 file_path,
             ],
             capture_output=True,
             text=True,
             check=True,
         )
-        codec_name = result.stdout.strip()
-
-        if codec_name:
-            return True, f'"{file_path}" can be converted to .mp4.'
+        streams = json.loads(result.stdout).get("streams", [])
+        video_codec = None
+        audio_codec = None
+        for stream in streams:
+            if stream.get("codec_type") == "video" and video_codec is None:
+                video_codec = stream.get("codec_name")
+            elif stream.get("codec_type") == "audio" and audio_codec is None:
+                audio_codec = stream.get("codec_name")
+
+        if video_codec:
+            return (
+                True,
+                f'"{file_path}" can be converted to .mp4.',
+                video_codec,
+                audio_codec,
+            )
         else:
             error_output = result.stderr.strip()
             return (
                 False,
                 f'Problem found in "{file_path}":\n{error_output}.\nFile will not be processed.\n',  # noqa: E501
+                None,
+                None,
             )
 
     except subprocess.CalledProcessError as errors:
@@ -175,46 +242,30 @@ def check_file_convertibility(file_path):
         return (
             False,
             f'Error checking "{file_path}":\n{error_output}.\nFile will not be processed.\n',  # noqa: E501
+            None,
+            None,
         )
 
 
+_SIZE_UNITS = ("B", "KB", "MB", "GB", "TB")
+
+
 def get_file_size(file_size):
     """
     Converts the given file size in bytes to a human-readable format (e.g., KB, MB, GB).
     Returns a string representing the human-readable file size.
-    """
-    for unit in ["B", "KB", "MB", "GB"]:
-        if file_size < 1024.0:
-            return f"{file_size:.1f} {unit}"
-        file_size /= 1024.0
-
 
-def convert_log_setup(output_directory):
-    """
-    Set up the logger for the conversion process and return the log file path.
-
-    :param output_directory: The directory where log files will be saved.
-    :return: The path to the log file.
+    The unit is derived from the bit length of the size, replacing the
+    old division loop (which also returned None for sizes of 1 TB or
+    more).
     """
-    log_file_name = (
-        f'{output_directory}/conversion_log_{time.strftime("%Y%m%d_%H%M%S")}.log'
+    unit_index = min(
+        max(int(file_size).bit_length() - 1, 0) // 10, len(_SIZE_UNITS) - 1
     )
-
-    logging.basicConfig(
-        filename=log_file_name,
-        level=logging.INFO,
-        format="%(asctime)s - %(levelname)s: %(message)s",
-        datefmt="%Y-%m-%d %H:%M:%S",
-    )
-
-    log_file = logging.getLogger()
-    log_file.info("Conversion Log")
-    log_file.info("==============================================")
-
-    return log_file_name
+    return f"{file_size / (1 << (unit_index * 10)):.1f} {_SIZE_UNITS[unit_index]}"
 
 
-def output_path(converted_folder, file_prefix):
+def output_path(converted_folder, file_prefix, existing_names):
     """
     Calculate the output file path based on the given file prefix and converted folder.
 
@@ -224,62 +275,80 @@ def output_path(converted_folder, file_prefix):
     tag will be added to the file prefix
     (e.g., "{converted_folder}/{file_prefix}_{counter}.mp4").
 
+    Collision checks run against a pre-scanned set of names rather than
+    stat'ing the filesystem per candidate, and the chosen name is
+    reserved in the set so concurrent conversions cannot pick the same
+    path.
+
     :param converted_folder: The folder where converted files are stored.
     :param file_prefix: The prefix to be added to the output file name.
+    :param existing_names: Set of file names already present in the folder.
     :return: The calculated output file path.
     """
     counter = 0  # Initialize the counter to 0
     while True:
         if counter == 0:
-            output_file_path = f"{converted_folder}/{file_prefix}_converted.mp4"
+            output_file_name = f"{file_prefix}_converted.mp4"
         else:
-            output_file_path = (
-                f"{converted_folder}/{file_prefix}_converted_{counter}.mp4"
-            )
-        if not os.path.exists(output_file_path):
-            return output_file_path
+            output_file_name = f"{file_prefix}_converted_{counter}.mp4"
+        if output_file_name not in existing_names:
+            existing_names.add(output_file_name)
+            return os.path.join(converted_folder, output_file_name)
 
         counter += 1
 
-def execute_ffmpeg(input_file, output_file):
-    system_platform = platform.system()
-    # Use platform-specific FFmpeg executable name
-    ffmpeg_executable = "ffmpeg.exe" if system_platform == "Windows" else "ffmpeg"
-    try:
-        subprocess.run(
-            # Experimental to standardize output resolution, bitrate, codec, and frame rate
-            [
-                ffmpeg_executable,
-                "-hide_banner",
-                "-i",
-                input_file,
-                "-c:v",
-                "libx264",
-                "-preset",
-                "medium",
-                "-b:v",
-                "3000k",
-                "-maxrate",
-                "4000k",
-                "-bufsize",
-                "6000k",
-                "-r",
-                "30",
-                "-c:a",
-                "aac",
-                "-b:a", 
-                "128k",
-                "-movflags",
-                "+faststart",
-                output_file,
-            ],
-            capture_output=True,
-            text=True,
-            check=True
+async def execute_ffmpeg(input_file, output_file, threads_per_job=0, codecs=None):
+    video_codec, audio_codec = codecs if codecs is not None else (None, None)
+    if video_codec == "h264" and audio_codec in ("aac", None):
+        # Already H.264 with MP4-safe (or no) audio: remux into the MP4
+        # container instead of paying for a full re-encode. Other audio
+        # codecs (PCM, Vorbis, ...) would fail the mux, so they take the
+        # re-encode path.
+        output_args = ("-c", "copy", "-movflags", "+faststart")
+    else:
+        # Experimental to standardize output resolution, bitrate, codec,
+        # and frame rate
+        output_args = (
+            "-c:v",
+            "libx264",
+            "-preset",
+            "medium",
+            "-b:v",
+            "3000k",
+            "-maxrate",
+            "4000k",
+            "-bufsize",
+            "6000k",
+            "-r",
+            "30",
+            "-c:a",
+            "aac",
+            "-b:a",
+            "128k",
+            "-movflags",
+            "+faststart",
+        )
+    process = await asyncio.create_subprocess_exec(
+        _FFMPEG,
+        "-hide_banner",
+        "-nostdin",
+        "-nostats",
+        "-loglevel",
+        "error",
+        "-i",
+        input_file,
+        *output_args,
+        "-threads",
+        str(threads_per_job),
+        output_file,
+        stdout=asyncio.subprocess.DEVNULL,
+        stderr=asyncio.subprocess.PIPE,
+    )
+    _stdout, stderr = await process.communicate()
+    if process.returncode != 0:
+        logger.info(
+            'Error converting "%s": %s\n', input_file, stderr.decode().strip()
         )
-    except subprocess.CalledProcessError as errors:
-        log_file = logging.getLogger()  # Get the logger again
-        log_file.info('Error converting "%s": %s\n', input_file, errors.stdout.strip())
 
 # def execute_ffmpeg(input_file, output_file):
 #     """
@@ -330,37 +399,57 @@ def execute_ffmpeg(input_file, output_file):
 #         )
 #     except subprocess.CalledProcessError as errors:
 #         log_file = logging.getLogger()  # Get the logger again
-#         log_file.info('Error converting "%s": %s\n', input_file, errors.stdout.strip())
+#         log_file.info(
+#             'Error converting "%s": %s\n', input_file, errors.stdout.strip()
+#         )
 
 
 def log_info(
-    file_name, original_file_size, output_file_path, new_file_size, start_time
+    file_name, original_file_size, output_basename, new_file_size, start_time
 ):
     """
-    Log information about each conversion.
+    Build the log message describing a single conversion.
+
+    The message is returned rather than logged directly so concurrent
+    workers can hand it to the single log-writer task.
 
     :param file_name: The name of the input file.
     :param original_file_size: The size of the original input file.
-    :param output_file_path: The path to the converted output file.
+    :param output_basename: The file name of the converted output file.
     :param new_file_size: The size of the converted output file.
     :param start_time: The start time of the conversion process.
+    :return: The formatted log message.
     """
     elapsed_time = time.time() - start_time  # Calculate the elapsed time
     minutes, seconds = divmod(elapsed_time, 60)
 
-    log_file = logging.getLogger()  # Get the logger
-
-    log_file.info(
-        '"%s" (%s) was converted to "%s" (%s) in %.0fm%.0fs.\n',
-        file_name,
-        get_file_size(original_file_size),
-        Path(output_file_path).name,
-        get_file_size(new_file_size),
-        minutes,
-        seconds,
+    return (
+        f'"{file_name}" ({get_file_size(original_file_size)}) was converted to '
+        f'"{output_basename}" ({get_file_size(new_file_size)}) '
+        f"in {minutes:.0f}m{seconds:.0f}s.\n"
     )
 
 
+async def log_writer(log_queue):
+    """
+    Drain log messages from the queue and write them through the logger.
+
+    Running all writes in one task keeps the file handle open for the
+    whole batch and serializes handler access without per-message locking
+    in the workers. A None message shuts the writer down.
+
+    :param log_queue: The asyncio.Queue the workers push messages onto.
+    """
+    while True:
+        message = await log_queue.get()
+        try:
+            if message is None:
+                break
+            logger.info(message)
+        finally:
+            log_queue.task_done()
+
+
 def summary_info(start_time, original_total_size, final_total_size):
     """
     Log summary information about the entire conversion process.
@@ -372,19 +461,76 @@ def summary_info(start_time, original_total_size, final_total_size):
     elapsed_time = time.time() - start_time  # Calculate the elapsed time
     minutes, seconds = divmod(elapsed_time, 60)
 
-    log_file = logging.getLogger()  # Get the logger
+    # One record instead of seven: a single formatter/handler pass per
+    # batch.
+    logger.info(
+        "Summary\n%s\n"
+        "Start Time: %s\n"
+        "End Time: %s\n"
+        "Elapsed Time: %dm%ds\n"
+        "Original total file size: %s\n"
+        "Final total file size: %s",
+        "=" * 48,
+        time.ctime(start_time),
+        time.ctime(time.time()),
+        minutes,
+        seconds,
+        get_file_size(original_total_size),
+        get_file_size(final_total_size),
+    )
+
+
+async def convert_one_file(
+    file_path,
+    converted_folder,
+    existing_names,
+    semaphore,
+    log_queue,
+    threads_per_job=0,
+    codecs=None,
+):
+    """Convert a single file to .mp4 under the concurrency semaphore.
+
+    Returns a tuple (original_file_size, new_file_size) for the summary totals.
+    """
+    async with semaphore:
+        # Create a new start time for each file conversion
+        start_time = time.time()
+
+        # os.path string ops avoid re-parsing the path into Path objects
+        # on every iteration.
+        file_name = os.path.basename(file_path)
+        file_prefix = os.path.splitext(file_name)[0].replace(" ", "_")
+
+        original_file_size = os.path.getsize(file_path)
 
-    log_file.info("Summary")
-    log_file.info("================================================")
-    log_file.info("Start Time: %s", time.ctime(start_time))
-    log_file.info("End Time: %s", time.ctime(time.time()))
-    log_file.info("Elapsed Time: %dm%ds", minutes, seconds)
-    log_file.info("Original total file size: %s", get_file_size(original_total_size))
-    log_file.info("Final total file size: %s", get_file_size(final_total_size))
+        output_file_path = output_path(converted_folder, file_prefix, existing_names)
 
+        await execute_ffmpeg(file_path, output_file_path, threads_per_job, codecs)
 
-def convert_files(file_paths, output_directory):
-    """Converts each file in the input directory to .mp4, using FFmpeg."""
+        new_file_size = os.path.getsize(output_file_path)
+
+        # Hand the conversion message to the single log-writer task
+        await log_queue.put(
+            log_info(
+                file_name,
+                original_file_size,
+                os.path.basename(output_file_path),
+                new_file_size,
+                start_time,
+            )
+        )
+
+        return original_file_size, new_file_size
+
+
+async def convert_files(file_paths, output_directory, codecs=None):
+    """Converts each file in the input directory to .mp4, using FFmpeg.
+
+    Conversions run concurrently through asyncio subprocesses, bounded by
+    a semaphore sized to the CPU count so the batch saturates the machine
+    without oversubscribing it.
+    """
     converted_folder = output_directory
 
     original_total_size = 0
@@ -392,42 +538,51 @@ def convert_files(file_paths, output_directory):
 
     total_start_time = time.time()  # Start time for the entire batch
 
-    for file_path in file_paths:
-        try:
-            # Create a new start time for each file conversion
-            start_time = time.time()
+    max_parallel = min(len(file_paths), os.cpu_count() or 1)
+    semaphore = asyncio.Semaphore(max_parallel)
 
-            file_name = Path(file_path).name
-            file_prefix = Path(file_path).stem
+    # Balance ffmpeg's internal threading against the number of encodes
+    # running at once so the batch does not oversubscribe the CPU.
+    threads_per_job = max(1, (os.cpu_count() or 2) // max_parallel)
 
-            file_prefix = file_prefix.replace(" ", "_")
+    # One directory listing up front replaces a stat syscall per collision
+    # candidate in output_path.
+    existing_names = set(os.listdir(converted_folder))
 
-            original_file_size = os.path.getsize(file_path)
-            original_total_size += original_file_size
+    log_queue = asyncio.Queue()
+    writer_task = asyncio.create_task(log_writer(log_queue))
 
-            output_file_path = output_path(converted_folder, file_prefix)
+    results = await asyncio.gather(
+        *(
+            convert_one_file(
+                file_path,
+                converted_folder,
+                existing_names,
+                semaphore,
+                log_queue,
+                threads_per_job,
+                (codecs or {}).get(file_path),
+            )
+            for file_path in file_paths
+        ),
+        return_exceptions=True,
+    )
 
-            execute_ffmpeg(file_path, output_file_path)
+    # Let the writer drain the remaining messages, then shut it down
+    await log_queue.join()
+    await log_queue.put(None)
+    await writer_task
 
-            new_file_size = os.path.getsize(output_file_path)
+    for file_path, result in zip(file_paths, results):
+        if isinstance(result, FileNotFoundError):
+            logger.error('File not found: "%s"\n', file_path)
+        elif isinstance(result, Exception):
+            logger.error('Error converting "%s": %s\n', file_path, result)
+        else:
+            original_file_size, new_file_size = result
+            original_total_size += original_file_size
             final_total_size += new_file_size
 
-            # Call log_info to log information about this conversion
-            log_info(
-                file_name,
-                original_file_size,
-                output_file_path,
-                new_file_size,
-                start_time,
-            )
-
-        except FileNotFoundError:
-            log_file = logging.getLogger()  # Get the logger again
-            log_file.error('File not found: "%s"\n', file_path)
-        except subprocess.CalledProcessError as err:
-            log_file = logging.getLogger()  # Get the logger again
-            log_file.error('Error converting "%s": %s\n', file_path, err)
-
     # Log the summary with the correct total elapsed time
     summary_info(total_start_time, original_total_size, final_total_size)
 
@@ -457,19 +612,19 @@ def main():
     # Call setup_logger with the log directory path and the enable_console flag
     log_file_name = setup_logger(output_directory, enable_console=args.console)
 
-    matching_files, scan_log_messages = scan_directory(input_directory)
+    matching_files, scan_log_messages, codecs = scan_directory(input_directory)
 
-    log_file_name = os.path.join(output_directory, "conversion_log.log")
-    log_file = logging.getLogger("mediaconv")
-    log_file.info("Scan Log")
-    log_file.info("================================================")
-    log_file.info("\n".join(scan_log_messages))
-    log_file.info("\n")
+    # One record instead of four: a single formatter/handler pass, and the
+    # join is only evaluated if INFO is actually enabled.
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(
+            "Scan Log\n%s\n%s\n", "=" * 48, "\n".join(scan_log_messages)
+        )
 
     if not matching_files:
         return
 
-    convert_files(matching_files, output_directory)
+    asyncio.run(convert_files(matching_files, output_directory, codecs))
 
     print(f'\nConversion complete. Log file saved to "{log_file_name}".\n')
 